@@ -0,0 +1,227 @@
+import bisect
+import collections
+import itertools
+
+
+class AllocationPolicy:
+    """Chooses a vacant lab for a class.
+
+    A policy keeps one capacity index per distinct set of required software,
+    holding only the labs that have all of it. The index for a set is built the
+    first time a class asks for it; afterwards LabManagementSystem reports every
+    lab that becomes occupied or is released, and each index the lab belongs to
+    is updated. `select` is then a capacity query on a single index and never
+    looks at labs that lack the software. Vacant labs always have their full
+    capacity free, so capacity is fixed while a lab is in an index.
+    """
+
+    name = None
+    index_class = None
+
+    def __init__(self, labs):
+        self.labs = list(labs)
+        self.indexes = {}                               # required software IDs -> index
+        self.member_of = {lab.lab_id: [] for lab in self.labs}  # lab ID -> indexes holding it
+
+    def _index(self, required_ids):
+        index = self.indexes.get(required_ids)
+        if index is None:
+            members = [lab for lab in self.labs if required_ids <= lab.software_ids]
+            index = self.indexes[required_ids] = self._new_index(members)
+            for lab in members:
+                self.member_of[lab.lab_id].append(index)
+        return index
+
+    def _new_index(self, members):
+        return self.index_class(members)
+
+    def occupied(self, lab):
+        for index in self.member_of[lab.lab_id]:
+            index.occupied(lab)
+
+    def released(self, lab):
+        for index in self.member_of[lab.lab_id]:
+            index.released(lab)
+
+    def select(self, num_students, required_ids, building=None):
+        """Returns a vacant lab with enough computers and the required software, or None."""
+        return self._index(required_ids).select(num_students)
+
+
+class FirstFitIndex:
+    """Max segment tree over capacities in lab order; occupied labs count as -1."""
+
+    def __init__(self, labs):
+        self.labs = labs
+        self.position = {lab.lab_id: i for i, lab in enumerate(labs)}
+        self.size = 1
+        while self.size < len(labs):
+            self.size *= 2
+        self.tree = [-1] * (2 * self.size)
+        for lab in labs:
+            if lab.current_class is None:
+                self.released(lab)
+
+    def _set(self, index, value):
+        index += self.size
+        self.tree[index] = value
+        index //= 2
+        while index:
+            self.tree[index] = max(self.tree[2 * index], self.tree[2 * index + 1])
+            index //= 2
+
+    def occupied(self, lab):
+        self._set(self.position[lab.lab_id], -1)
+
+    def released(self, lab):
+        self._set(self.position[lab.lab_id], lab.num_computers)
+
+    def select(self, num_students):
+        """The leftmost vacant lab with at least num_students computers, in O(log n)."""
+        if self.tree[1] < num_students:
+            return None
+        node = 1
+        while node < self.size:
+            node = 2 * node if self.tree[2 * node] >= num_students else 2 * node + 1
+        return self.labs[node - self.size]
+
+
+class BestFitIndex:
+    """Vacant labs sorted by (capacity, lab ID).
+
+    Selection is a bisection; an update shifts the tail of the list, which is a
+    single memmove rather than a Python-level scan.
+    """
+
+    def __init__(self, labs):
+        self.vacant = []
+        self.by_id = {lab.lab_id: lab for lab in labs}
+        for lab in labs:
+            if lab.current_class is None:
+                self.released(lab)
+
+    def occupied(self, lab):
+        key = (lab.num_computers, lab.lab_id)
+        index = bisect.bisect_left(self.vacant, key)
+        if index < len(self.vacant) and self.vacant[index] == key:
+            del self.vacant[index]
+
+    def released(self, lab):
+        key = (lab.num_computers, lab.lab_id)
+        index = bisect.bisect_left(self.vacant, key)
+        if index == len(self.vacant) or self.vacant[index] != key:
+            self.vacant.insert(index, key)
+
+    def select(self, num_students):
+        """The smallest vacant lab that fits, found by bisection."""
+        index = bisect.bisect_left(self.vacant, (num_students,))
+        return self.by_id[self.vacant[index][1]] if index < len(self.vacant) else None
+
+
+class LeastRecentlyUsedIndex:
+    """One release-ordered queue of vacant labs per distinct capacity.
+
+    `released_at` maps lab IDs to release sequence numbers and is shared with
+    the policy, so an index built late still knows which lab has waited longest.
+    """
+
+    def __init__(self, labs, released_at):
+        self.released_at = released_at
+        self.capacities = sorted({lab.num_computers for lab in labs})
+        self.queues = {capacity: collections.OrderedDict() for capacity in self.capacities}
+        for lab in sorted(labs, key=lambda lab: released_at[lab.lab_id]):
+            if lab.current_class is None:
+                self.released(lab)
+
+    def occupied(self, lab):
+        self.queues[lab.num_computers].pop(lab.lab_id, None)
+
+    def released(self, lab):
+        queue = self.queues[lab.num_computers]
+        if lab.lab_id not in queue:
+            queue[lab.lab_id] = (self.released_at[lab.lab_id], lab)
+
+    def select(self, num_students):
+        """Compares the head of each large-enough queue: O(distinct capacities)."""
+        best = None
+        for index in range(bisect.bisect_left(self.capacities, num_students), len(self.capacities)):
+            queue = self.queues[self.capacities[index]]
+            if queue:
+                head = next(iter(queue.values()))
+                if best is None or head[0] < best[0]:
+                    best = head
+        return best[1] if best else None
+
+
+class FirstFitPolicy(AllocationPolicy):
+    """The first suitable lab in list order."""
+
+    name = "first-fit"
+    index_class = FirstFitIndex
+
+
+class BestFitPolicy(AllocationPolicy):
+    """The suitable lab that leaves the fewest seats empty."""
+
+    name = "best-fit"
+    index_class = BestFitIndex
+
+
+class LeastRecentlyUsedPolicy(AllocationPolicy):
+    """The suitable lab that has been vacant longest, spreading wear across labs."""
+
+    name = "least-recently-used"
+
+    def __init__(self, labs):
+        super().__init__(labs)
+        self.sequence = itertools.count()
+        self.released_at = {lab.lab_id: next(self.sequence) for lab in self.labs}
+        self.occupied_ids = {lab.lab_id for lab in self.labs if lab.current_class is not None}
+
+    def _new_index(self, members):
+        return LeastRecentlyUsedIndex(members, self.released_at)
+
+    def occupied(self, lab):
+        self.occupied_ids.add(lab.lab_id)
+        super().occupied(lab)
+
+    def released(self, lab):
+        if lab.lab_id in self.occupied_ids:
+            self.occupied_ids.discard(lab.lab_id)
+            self.released_at[lab.lab_id] = next(self.sequence)
+        super().released(lab)
+
+
+class BuildingLocalityPolicy(AllocationPolicy):
+    """Best fit within the requested building, falling back to best fit anywhere."""
+
+    name = "building-locality"
+
+    def __init__(self, labs):
+        super().__init__(labs)
+        self.anywhere = BestFitPolicy(self.labs)
+        grouped = {}
+        for lab in self.labs:
+            grouped.setdefault(lab.building, []).append(lab)
+        self.buildings = {building: BestFitPolicy(members) for building, members in grouped.items()}
+
+    def occupied(self, lab):
+        self.anywhere.occupied(lab)
+        self.buildings[lab.building].occupied(lab)
+
+    def released(self, lab):
+        self.anywhere.released(lab)
+        self.buildings[lab.building].released(lab)
+
+    def select(self, num_students, required_ids, building=None):
+        if building in self.buildings:
+            lab = self.buildings[building].select(num_students, required_ids)
+            if lab is not None:
+                return lab
+        return self.anywhere.select(num_students, required_ids)
+
+
+POLICIES = {
+    policy.name: policy
+    for policy in (FirstFitPolicy, BestFitPolicy, LeastRecentlyUsedPolicy, BuildingLocalityPolicy)
+}
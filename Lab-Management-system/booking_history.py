@@ -0,0 +1,54 @@
+import collections
+import datetime
+
+BookingRecord = collections.namedtuple(
+    "BookingRecord", "lab_id class_name software start duration_hours num_students dated")
+BookingRecord.__doc__ = """One row of lab_data.csv.
+
+`dated` is False when the row only had a clock time and no earlier row gave it
+a date; `start` is then placed relative to UNDATED_ORIGIN.
+"""
+
+# Day given to time-only rows that no dated row precedes.
+UNDATED_ORIGIN = datetime.date(1970, 1, 1)
+
+
+def format_start_time(moment):
+    """Formats a booking start time the way the booking writers record it."""
+    return moment.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def parse_booking_rows(rows, previous=None):
+    """Parses lab_data.csv rows (lab, class, software, start, duration, students).
+
+    Start times are ISO datetimes. Older rows only carry "%H:%M:%S"; such a row
+    is taken to be on the same day as the row before it, or the next day when
+    its clock time is earlier. `previous` is the last record of an earlier call,
+    so a file can be parsed in pieces. Malformed rows are skipped.
+    """
+    records = []
+    for row in rows:
+        if len(row) < 6:
+            continue
+        try:
+            value = row[3].strip()
+            try:
+                start = datetime.datetime.fromisoformat(value)
+                dated = True
+            except ValueError:
+                clock_time = datetime.datetime.strptime(value, "%H:%M:%S").time()
+                if previous is None:
+                    day, dated = UNDATED_ORIGIN, False
+                else:
+                    day, dated = previous.start.date(), previous.dated
+                    if clock_time < previous.start.time():
+                        day += datetime.timedelta(days=1)
+                start = datetime.datetime.combine(day, clock_time)
+            duration = float(row[4])
+            students = int(row[5])
+        except ValueError:
+            continue
+        software = [s.strip() for s in row[2].split(",") if s.strip()]
+        previous = BookingRecord(row[0].strip(), row[1], software, start, duration, students, dated)
+        records.append(previous)
+    return records
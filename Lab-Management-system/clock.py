@@ -0,0 +1,69 @@
+import heapq
+import itertools
+import threading
+import time
+
+
+class WallClock:
+    """Real time; callbacks run on a timer thread once the delay has passed."""
+
+    def now(self):
+        return time.time()
+
+    def call_later(self, delay, callback, *args):
+        timer = threading.Timer(delay, callback, args)
+        timer.start()
+        return timer
+
+
+class ScheduledEvent:
+    def __init__(self, when, callback, args):
+        self.when = when
+        self.callback = callback
+        self.args = args
+        self.cancelled = False
+
+    def cancel(self):
+        self.cancelled = True
+
+
+class VirtualClock:
+    """Simulated time driven by an event queue.
+
+    Time only moves when `run` pops the next event, so hours of bookings are
+    replayed as fast as their callbacks execute.
+    """
+
+    def __init__(self, start=0.0):
+        self.time = start
+        self._queue = []
+        self._sequence = itertools.count()
+
+    def now(self):
+        return self.time
+
+    def call_at(self, when, callback, *args):
+        event = ScheduledEvent(max(when, self.time), callback, args)
+        # The sequence number keeps events at the same instant in scheduling order.
+        heapq.heappush(self._queue, (event.when, next(self._sequence), event))
+        return event
+
+    def call_later(self, delay, callback, *args):
+        return self.call_at(self.time + delay, callback, *args)
+
+    def run(self, until=None):
+        """Processes events in time order until the queue is empty or `until` is reached."""
+        while self._queue:
+            when, _, event = self._queue[0]
+            if until is not None and when > until:
+                break
+            heapq.heappop(self._queue)
+            if event.cancelled:
+                continue
+            self.time = when
+            event.callback(*event.args)
+        if until is not None:
+            self.time = max(self.time, until)
+
+
+WALL_CLOCK = WallClock()
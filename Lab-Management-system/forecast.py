@@ -0,0 +1,208 @@
+import argparse
+import csv
+import datetime
+import os
+
+import numpy as np
+
+from booking_history import BookingRecord, format_start_time, parse_booking_rows
+from software_catalog import DEFAULT_CATALOG
+
+HOURS_PER_WEEK = 7 * 24
+# Week numbers count whole weeks from this Monday.
+EPOCH = datetime.datetime(1970, 1, 5)
+
+
+def week_of(day):
+    return (day - EPOCH.date()).days // 7
+
+
+def week_start(week):
+    return (EPOCH + datetime.timedelta(weeks=week)).date()
+
+
+class DemandForecaster:
+    """Forecasts seat demand per hour-of-week slot from the booking history.
+
+    Bookings are folded into one 168-slot array of seat-hours per calendar week
+    (and per software), so training is incremental: only rows appended to
+    lab_data.csv since the last run are parsed. Forecasts run Holt's linear
+    smoothing over the weekly arrays, vectorised across all slots.
+    """
+
+    def __init__(self, catalog=DEFAULT_CATALOG, alpha=0.3, beta=0.1):
+        self.catalog = catalog
+        self.alpha = alpha
+        self.beta = beta
+        self.seats = {}       # week -> (168,) seat-hours
+        self.software = {}    # software name -> {week -> (168,) seat-hours}
+        self.offset = 0       # bytes of the booking CSV already consumed
+        self.previous = None  # last BookingRecord read, dates the next time-only row
+
+    def observe(self, software, start, duration_hours, num_students):
+        """Adds one booking. `software` is a list of names; unknown names are ignored.
+
+        Names are matched exactly, as for installed software, and a versioned
+        name also counts towards its product.
+        """
+        names = set()
+        for name in software:
+            software_id = self.catalog.resolve(name, fuzzy=False) if name.strip() else None
+            while software_id is not None:
+                names.add(self.catalog.name_of(software_id))
+                software_id = self.catalog.parent[software_id]
+
+        elapsed = start - EPOCH
+        position = elapsed.days * 24 + elapsed.seconds / 3600
+        remaining = float(duration_hours)
+        while remaining > 0:
+            hour = int(position)
+            used = min(remaining, hour + 1 - position)
+            week, slot = divmod(hour, HOURS_PER_WEEK)
+            self._add(self.seats, week, slot, num_students * used)
+            for name in names:
+                self._add(self.software.setdefault(name, {}), week, slot, num_students * used)
+            position += used
+            remaining -= used
+
+    @staticmethod
+    def _add(weeks, week, slot, seat_hours):
+        if week not in weeks:
+            weeks[week] = np.zeros(HOURS_PER_WEEK)
+        weeks[week][slot] += seat_hours
+
+    def update_from_csv(self, path="lab_data.csv"):
+        """Trains on rows appended to `path` since the last call.
+
+        Returns (trained, undated) row counts. Old time-only rows are dated by
+        parse_booking_rows; those that no dated row precedes cannot be placed in
+        a week and are skipped.
+        """
+        if not os.path.exists(path):
+            return 0, 0
+        if os.path.getsize(path) < self.offset:
+            # The file was replaced, so the history it was trained on is gone.
+            self.seats, self.software, self.offset, self.previous = {}, {}, 0, None
+
+        with open(path, "rb") as file:
+            file.seek(self.offset)
+            data = file.read()
+        complete = data[:data.rfind(b"\n") + 1]
+        self.offset += len(complete)
+
+        records = parse_booking_rows(csv.reader(complete.decode("utf-8").splitlines()), self.previous)
+        trained = 0
+        for record in records:
+            if record.dated:
+                self.observe(record.software, record.start, record.duration_hours, record.num_students)
+                trained += 1
+        if records:
+            self.previous = records[-1]
+        return trained, len(records) - trained
+
+    def _smooth(self, weeks, first, last, horizon):
+        """Holt's linear method over weeks first..last, projected `horizon` weeks on."""
+        level = weeks.get(first, np.zeros(HOURS_PER_WEEK)).copy()
+        trend = np.zeros(HOURS_PER_WEEK)
+        empty = np.zeros(HOURS_PER_WEEK)
+        for week in range(first + 1, last + 1):
+            previous = level
+            level = self.alpha * weeks.get(week, empty) + (1 - self.alpha) * (level + trend)
+            trend = self.beta * (level - previous) + (1 - self.beta) * trend
+        steps = np.arange(1, horizon + 1)[:, None]
+        return np.maximum(level + steps * trend, 0).reshape(horizon, 7, 24)
+
+    def forecast(self, weeks=4, today=None):
+        """Expected seats per (week, weekday, hour) from the week of `today` onwards.
+
+        Only weeks that have ended are smoothed; bookings in the current, partial
+        week wait until it is over, so they do not read as a drop in demand.
+        Returns a dict with "weeks" (Monday dates), "seats" (weeks x 7 x 24) and
+        "software" mapping each software name to its own weeks x 7 x 24 array.
+        """
+        today = today or datetime.date.today()
+        if isinstance(today, datetime.datetime):
+            today = today.date()
+        current = week_of(today)
+        last = current - 1
+        starts = [week_start(current + i) for i in range(weeks)]
+        complete = [week for week in self.seats if week <= last]
+        if not complete:
+            return {"weeks": starts, "seats": np.zeros((weeks, 7, 24)), "software": {}}
+        first = min(complete)
+        return {
+            "weeks": starts,
+            "seats": self._smooth(self.seats, first, last, weeks),
+            "software": {name: self._smooth(history, first, last, weeks)
+                         for name, history in self.software.items()},
+        }
+
+    def save(self, path):
+        names = sorted(self.software)
+        software_rows = [(i, week, seats) for i, name in enumerate(names)
+                         for week, seats in self.software[name].items()]
+        previous = self.previous
+        # Writing through a handle stops np.savez from appending ".npz" to the path.
+        with open(path, "wb") as file:
+            np.savez(
+                file,
+                offset=self.offset,
+                previous_start=format_start_time(previous.start) if previous else "",
+                previous_dated=bool(previous and previous.dated),
+                weeks=np.array(list(self.seats), dtype=np.int64),
+                seats=np.array(list(self.seats.values())).reshape(-1, HOURS_PER_WEEK),
+                names=np.array(names, dtype=str),
+                software_index=np.array([row[0] for row in software_rows], dtype=np.int64),
+                software_weeks=np.array([row[1] for row in software_rows], dtype=np.int64),
+                software_seats=np.array([row[2] for row in software_rows]).reshape(-1, HOURS_PER_WEEK),
+            )
+
+    @classmethod
+    def load(cls, path, **kwargs):
+        forecaster = cls(**kwargs)
+        with np.load(path) as state:
+            forecaster.offset = int(state["offset"])
+            if str(state["previous_start"]):
+                # Only the date, time and dated flag matter for reading later rows.
+                start = datetime.datetime.fromisoformat(str(state["previous_start"]))
+                forecaster.previous = BookingRecord("", "", [], start, 0.0, 0, bool(state["previous_dated"]))
+            forecaster.seats = dict(zip(state["weeks"].tolist(), state["seats"]))
+            names = state["names"].tolist()
+            for index, week, seats in zip(state["software_index"].tolist(),
+                                          state["software_weeks"].tolist(),
+                                          state["software_seats"]):
+                forecaster.software.setdefault(names[index], {})[week] = seats
+        return forecaster
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Forecast lab seat demand from lab_data.csv.")
+    parser.add_argument("bookings", nargs="?", default="lab_data.csv")
+    parser.add_argument("--state", default="forecast_state.npz", help="saved model, updated in place")
+    parser.add_argument("--weeks", type=int, default=2)
+    args = parser.parse_args()
+
+    if os.path.exists(args.state):
+        forecaster = DemandForecaster.load(args.state)
+    else:
+        forecaster = DemandForecaster()
+    trained, undated = forecaster.update_from_csv(args.bookings)
+    forecaster.save(args.state)
+    print(f"Trained on {trained} new booking(s).")
+    if undated:
+        print(f"Skipped {undated} old booking(s) recorded without a date.")
+
+    result = forecaster.forecast(args.weeks)
+    days = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+    for i, monday in enumerate(result["weeks"]):
+        print(f"\nWeek of {monday}: peak expected seats per day")
+        for day, name in enumerate(days):
+            hours = result["seats"][i, day]
+            print(f"  {name}: {hours.max():.1f} at {int(hours.argmax()):02d}:00")
+        print("  Seat-hours per software:")
+        for name, demand in sorted(result["software"].items()):
+            print(f"    {name}: {demand[i].sum():.1f}")
+
+
+if __name__ == "__main__":
+    main()
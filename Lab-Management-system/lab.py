@@ -5,7 +5,7 @@ import csv
 
 # --------------------- Lab Class ---------------------
 class Lab:
-    def __init__(self, lab_id, num_computers, softwares_installed):
+    def __init__(self, lab_id, num_computers, softwares_installed, on_assign=None, on_release=None):
         self.lab_id = lab_id
         self.num_computers = num_computers
         self.available_computers = num_computers
@@ -16,15 +16,19 @@ class Lab:
         self.assigned_time = None
         self.time_duration = None
         self.total_students = None
+        self.on_assign = on_assign
+        self.on_release = on_release
 
     def assign_class(self, class_name, subject, num_students, class_duration_hours):
         if self.current_class is None and num_students <= self.available_computers:
             self.current_class = class_name
             self.subject = subject
             self.available_computers -= num_students
-            self.assigned_time = time.strftime("%H:%M:%S")
+            self.assigned_time = time.strftime("%Y-%m-%d %H:%M:%S")
             self.time_duration = class_duration_hours
             self.total_students = num_students
+            if self.on_assign:
+                self.on_assign(self)
 
             if 'status_text' in globals():
                 status_text.insert(tk.END, f"✅ Class '{class_name}' (Subject: {subject}) assigned to Lab {self.lab_id} for {class_duration_hours} hours.\n")
@@ -42,6 +46,8 @@ class Lab:
         time.sleep(class_duration)
         self.current_class = None
         self.available_computers = self.num_computers
+        if self.on_release:
+            self.on_release(self)
 
         if 'status_text' in globals():
             status_text.insert(tk.END, f"⏳ Class '{class_name}' completed in Lab {self.lab_id}.\n")
@@ -56,9 +62,21 @@ class Lab:
 # --------------------- Lab Management System ---------------------
 class LabManagementSystem:
     def __init__(self, lab_capacity_list, software_list):
-        self.labs = [Lab(i + 1, num_computers, software_list[i]) for i, num_computers in enumerate(lab_capacity_list)]
+        # Running count of occupied labs, so status reads do not rescan every lab.
+        self.lock = threading.Lock()
+        self.occupied_count = 0
+        self.labs = [Lab(i + 1, num_computers, software_list[i], self._lab_assigned, self._lab_released)
+                     for i, num_computers in enumerate(lab_capacity_list)]
         self.save_lab_capacities(software_list)
 
+    def _lab_assigned(self, lab):
+        with self.lock:
+            self.occupied_count += 1
+
+    def _lab_released(self, lab):
+        with self.lock:
+            self.occupied_count -= 1
+
     def assign_class_to_lab(self, class_name, subject, num_students, class_duration_hours):
         for lab in self.labs:
             if lab.current_class is None and num_students <= lab.available_computers:
@@ -68,7 +86,8 @@ class LabManagementSystem:
             status_text.insert(tk.END, "❌ No available labs with enough capacity at the moment.\n")
 
     def get_occupied_and_vacant_labs(self):
-        occupied = sum(1 for lab in self.labs if lab.current_class is not None)
+        with self.lock:
+            occupied = self.occupied_count
         vacant = len(self.labs) - occupied
         return occupied, vacant
 
@@ -114,7 +133,7 @@ def save_and_show_data():
     global lab_system, lab_status_text  
 
     lab_capacity_list = [int(entry.get()) for entry in lab_capacity_entries]
-    software_list = [software_entry.get().split(",") for software_entry in software_entries]
+    software_list = [[s.strip() for s in software_entry.get().split(",") if s.strip()] for software_entry in software_entries]
 
     lab_system = LabManagementSystem(lab_capacity_list, software_list)
 
@@ -3,24 +3,35 @@ import threading
 import time
 import csv
 import datetime
+import collections
+from allocation import AllocationPolicy, POLICIES
+from booking_history import format_start_time
+from clock import WALL_CLOCK
+from software_catalog import SOFTWARE_OPTIONS, DEFAULT_CATALOG
 
-SOFTWARE_OPTIONS = [
-    "ANACONDA3", "DEV C++", "TURBO C++", "PYTHON", "VS CODE", "JAVA", "JDK",
-    "TALLY PRIME", "GOOGLE CHROME", "R STUDIO", "MYSQL SERVER AND WORKBENCH",
-    "ORACLE VM VIRTUAL BOX", "CISCO PACKET TRACER", "XCODE", "ADOBE READER XI",
-    "AUTOCAD 2024", "LINUX (UBUNTU - CMD BASED)", "WINRAR", "NODEJS", "ECLIPCE IDE",
-    "LINUX - UBUNTU", "TABLEAU", "MATLAB R2024b"
-]
+OccupancySnapshot = collections.namedtuple(
+    "OccupancySnapshot", "occupied vacant total_seats free_seats bookable_seats software_bookable buildings")
+BuildingOccupancy = collections.namedtuple(
+    "BuildingOccupancy", "labs occupied vacant total_seats free_seats bookable_seats")
 
 class Lab:
-    def __init__(self, lab_id, num_computers, softwares_installed):
+    def __init__(self, lab_id, num_computers, softwares_installed, catalog=DEFAULT_CATALOG, clock=WALL_CLOCK,
+                 on_release=None, building=None, on_assign=None, booking_log=None):
         self.lab_id = lab_id
+        self.building = building
         self.num_computers = num_computers
         self.available_computers = num_computers
         self.softwares_installed = softwares_installed
+        self.software_ids = catalog.installed_ids(softwares_installed)
+        self.clock = clock
+        self.on_assign = on_assign
+        self.on_release = on_release
+        self.booking_log = booking_log
         self.current_class = None
         self.subject = None
-        self.assignment_thread = None
+        self.expiry = None
+        self.booking_number = 0  # identifies the assignment an expiry belongs to
+        self.assigned_at = None
         self.assigned_time = None
         self.time_duration = None
         self.total_students = None
@@ -30,25 +41,39 @@ class Lab:
             self.current_class = class_name
             self.subject = subject
             self.available_computers -= num_students
-            self.assigned_time = time.strftime("%H:%M:%S")
+            self.assigned_at = self.clock.now()
+            self.assigned_time = time.strftime("%H:%M:%S", time.localtime(self.assigned_at))
             self.time_duration = class_duration_hours
             self.total_students = num_students
+            if self.on_assign:
+                self.on_assign(self)
 
             if 'status_text' in globals():
                 status_text.insert(tk.END, f"✅ Class '{class_name}' (Software: {subject}) assigned to Lab {self.lab_id} for {class_duration_hours} hours.\n")
 
-            self.assignment_thread = threading.Thread(target=self.run_class, args=(class_name, class_duration_hours * 3600))
-            self.assignment_thread.start()
+            self.booking_number += 1
+            self.expiry = self.clock.call_later(class_duration_hours * 3600, self.run_class, class_name,
+                                                self.booking_number)
 
+            if self.booking_log:
+                self.save_to_csv()
             update_lab_status()
+            return True
         else:
             if 'status_text' in globals():
                 status_text.insert(tk.END, f"⚠ Lab {self.lab_id} is occupied or doesn't have enough computers.\n")
+            return False
 
-    def run_class(self, class_name, class_duration):
-        time.sleep(class_duration)
+    def run_class(self, class_name, booking_number):
+        """Called by the clock when the class's time is up."""
+        if booking_number != self.booking_number or self.current_class is None:
+            # The class was removed; a timer that had already fired cannot be cancelled.
+            return
+        self.expiry = None
         self.current_class = None
         self.available_computers = self.num_computers
+        if self.on_release:
+            self.on_release(self)
 
         def update_ui():
             if 'status_text' in globals():
@@ -58,12 +83,15 @@ class Lab:
         if 'status_text' in globals() and status_text.winfo_exists():
             status_text.after(0, update_ui)
 
+    def save_to_csv(self):
+        start = format_start_time(datetime.datetime.fromtimestamp(self.assigned_at))
+        with open(self.booking_log, mode="a", newline="") as file:
+            writer = csv.writer(file)
+            writer.writerow([self.lab_id, self.current_class, self.subject, start, self.time_duration, self.total_students])
+
     def get_remaining_time(self):
-        if self.current_class and self.assigned_time:
-            today = datetime.datetime.now().date()
-            assigned_dt = datetime.datetime.combine(today, datetime.datetime.strptime(self.assigned_time, "%H:%M:%S").time())
-            now = datetime.datetime.now()
-            elapsed = (now - assigned_dt).total_seconds()
+        if self.current_class and self.assigned_at is not None:
+            elapsed = self.clock.now() - self.assigned_at
             remaining = self.time_duration * 3600 - elapsed
             if remaining < 0:
                 remaining = 0
@@ -71,32 +99,145 @@ class Lab:
         return "-"
 
     def remove_class(self):
+        if self.expiry is not None:
+            # Stops a pending timer; run_class ignores one that has already fired.
+            self.expiry.cancel()
+            self.expiry = None
         self.current_class = None
         self.available_computers = self.num_computers
         self.subject = None
+        self.assigned_at = None
         self.assigned_time = None
         self.time_duration = None
         self.total_students = None
+        if self.on_release:
+            self.on_release(self)
         update_lab_status()
         if 'status_text' in globals():
             status_text.insert(tk.END, f"🗑️ Class manually removed from Lab {self.lab_id}.\n")
 
 class LabManagementSystem:
-    def __init__(self, lab_capacity_list, software_list):
-        self.labs = [Lab(i + 1, num_computers, software_list[i]) for i, num_computers in enumerate(lab_capacity_list)]
-
-    def assign_class_to_lab(self, class_name, required_software, num_students, class_duration_hours):
+    def __init__(self, lab_capacity_list, software_list, catalog=None, clock=WALL_CLOCK,
+                 policy="first-fit", buildings=None, booking_log="lab_data.csv"):
+        # Labs register their installed software, so each system gets its own catalog.
+        self.catalog = catalog = catalog if catalog is not None else DEFAULT_CATALOG.copy()
+        self.clock = clock
+        self.release_listeners = []
+        self.labs = [Lab(i + 1, num_computers, software_list[i], catalog, clock,
+                         on_release=self._lab_released, on_assign=self._lab_assigned,
+                         building=buildings[i] if buildings else None, booking_log=booking_log)
+                     for i, num_computers in enumerate(lab_capacity_list)]
+        self.policies = {}
+        self.policy = self.get_policy(policy)
+
+        # Running aggregates, changed in place on every assign and release so that
+        # status reads never walk the labs. The lock keeps them consistent with
+        # each other while clock threads release labs. Free seats are the idle
+        # computers in every lab; bookable seats only count vacant labs, since a
+        # lab holds one class at a time and its leftover computers cannot be booked.
+        self.lock = threading.RLock()
+        self.occupied_count = 0
+        self.total_seats = sum(lab.num_computers for lab in self.labs)
+        self.free_seats = self.total_seats
+        self.bookable_seats = self.total_seats
+        self.software_bookable = {}  # software ID -> computers in vacant labs that have it
+        self.building_totals = {}    # building -> [labs, occupied, total, free, bookable seats]
+        self.seats_taken = {}        # lab ID -> computers held by its current class
         for lab in self.labs:
-            if (
-                lab.current_class is None and
-                num_students <= lab.available_computers and
-                all(software.strip().lower() in (s.lower() for s in lab.softwares_installed) for software in required_software)
-            ):
-                lab.assign_class(class_name, ", ".join(required_software), num_students, class_duration_hours)
-                return
+            for software_id in lab.software_ids:
+                self.software_bookable[software_id] = self.software_bookable.get(software_id, 0) + lab.num_computers
+            totals = self.building_totals.setdefault(lab.building, [0, 0, 0, 0, 0])
+            totals[0] += 1
+            totals[2] += lab.num_computers
+            totals[3] += lab.num_computers
+            totals[4] += lab.num_computers
+
+    def get_policy(self, policy):
+        """Returns the policy for a name or AllocationPolicy subclass, building it on first use.
+
+        Every policy built so far is kept in sync with the labs, so switching
+        policy per request does not need a rescan.
+        """
+        if isinstance(policy, str):
+            policy = POLICIES.get(policy, policy)
+        if policy not in self.policies:
+            if not (isinstance(policy, type) and issubclass(policy, AllocationPolicy)):
+                raise ValueError(f"Unknown allocation policy: {policy!r}")
+            self.policies[policy] = policy(self.labs)
+        return self.policies[policy]
+
+    def _update_aggregates(self, lab, seats, occupied):
+        self.occupied_count += occupied
+        self.free_seats -= seats
+        self.bookable_seats -= occupied * lab.num_computers
+        for software_id in lab.software_ids:
+            self.software_bookable[software_id] -= occupied * lab.num_computers
+        totals = self.building_totals[lab.building]
+        totals[1] += occupied
+        totals[3] -= seats
+        totals[4] -= occupied * lab.num_computers
+
+    def _lab_assigned(self, lab):
+        with self.lock:
+            for policy in self.policies.values():
+                policy.occupied(lab)
+            self.seats_taken[lab.lab_id] = lab.total_students
+            self._update_aggregates(lab, lab.total_students, 1)
+
+    def _lab_released(self, lab):
+        with self.lock:
+            for policy in self.policies.values():
+                policy.released(lab)
+            seats = self.seats_taken.pop(lab.lab_id, None)
+            if seats is not None:
+                self._update_aggregates(lab, -seats, -1)
+            for listener in self.release_listeners:
+                listener(lab)
+
+    def get_occupied_and_vacant_labs(self):
+        with self.lock:
+            return self.occupied_count, len(self.labs) - self.occupied_count
+
+    def snapshot(self):
+        """Returns a consistent OccupancySnapshot of the running aggregates.
+
+        The cost depends on the number of software titles and buildings, not labs.
+        `software_bookable` maps canonical software names to the computers in
+        vacant labs that have them, i.e. what a new class could still book.
+        """
+        with self.lock:
+            return OccupancySnapshot(
+                self.occupied_count,
+                len(self.labs) - self.occupied_count,
+                self.total_seats,
+                self.free_seats,
+                self.bookable_seats,
+                {self.catalog.name_of(software_id): seats for software_id, seats in self.software_bookable.items()},
+                {building: BuildingOccupancy(labs, occupied, labs - occupied, total, free, bookable)
+                 for building, (labs, occupied, total, free, bookable) in self.building_totals.items()},
+            )
+
+    def assign_class_to_lab(self, class_name, required_software, num_students, class_duration_hours,
+                            policy=None, building=None):
+        """Assigns the class to a lab chosen by `policy` (the system policy by default).
+
+        `building` is a locality hint for policies that use it. Returns the lab, or None.
+        """
+        required_ids = self.catalog.required_ids(required_software)
+        if required_ids is None:
+            if 'status_text' in globals():
+                status_text.insert(tk.END, f"❌ Unknown software requested: {self.catalog.describe_unknown(required_software)}.\n")
+            return None
+
+        with self.lock:
+            allocator = self.policy if policy is None else self.get_policy(policy)
+            lab = allocator.select(num_students, required_ids, building)
+            if lab is not None and lab.assign_class(class_name, ", ".join(required_software), num_students, class_duration_hours):
+                return lab
 
         if 'status_text' in globals():
             status_text.insert(tk.END, "❌ No suitable labs found with required software and capacity.\n")
+        return None
 
 def setup_lab_entries():
     global lab_capacity_entries, software_vars
@@ -203,6 +344,8 @@ def open_class_assignment_tab():
 def update_lab_status():
     if 'lab_status_text' in globals():
         lab_status_text.delete(1.0, tk.END)
+        summary = lab_system.snapshot()
+        lab_status_text.insert(tk.END, f"📌 Labs Status: {summary.occupied} occupied, {summary.vacant} vacant | {summary.free_seats}/{summary.total_seats} computers free, {summary.bookable_seats} in vacant labs\n")
         for lab in lab_system.labs:
             lab_status_text.insert(tk.END, f"Lab {lab.lab_id} | {lab.available_computers}/{lab.num_computers} free | Class: {lab.current_class or '-'} | Software: {lab.subject or '-'} | Time Left: {lab.get_remaining_time()}\n")
 
@@ -222,6 +365,8 @@ def open_lab_dashboard():
     canvas.pack(side="left", fill="both", expand=True)
     scrollbar.pack(side="right", fill="y")
 
+    summary_label = tk.Label(scrollable_frame, font=("Arial", 12, "bold"), justify="left")
+    summary_label.pack(anchor="w", padx=10, pady=5)
     lab_cards = []
 
     def refresh():
@@ -230,6 +375,13 @@ def open_lab_dashboard():
         lab_cards.clear()
 
         if 'lab_system' in globals():
+            summary = lab_system.snapshot()
+            lines = [f"{summary.occupied} occupied, {summary.vacant} vacant | {summary.free_seats}/{summary.total_seats} computers free, {summary.bookable_seats} in vacant labs"]
+            for building, totals in summary.buildings.items():
+                if building is not None:
+                    lines.append(f"{building}: {totals.occupied}/{totals.labs} labs occupied | {totals.free_seats}/{totals.total_seats} computers free, {totals.bookable_seats} in vacant labs")
+            summary_label.config(text="\n".join(lines))
+
             for lab in lab_system.labs:
                 if lab.current_class:
                     if lab.available_computers == 0:
@@ -264,27 +416,28 @@ def open_lab_dashboard():
     refresh()
 
 # --------------------- Main Window ---------------------
-root = tk.Tk()
-root.title("Lab Management Dashboard")
+if __name__ == "__main__":
+    root = tk.Tk()
+    root.title("Lab Management Dashboard")
 
-tk.Label(root, text="Enter number of labs:").grid(row=0, column=0)
-num_labs_entry = tk.Entry(root)
-num_labs_entry.grid(row=0, column=1)
+    tk.Label(root, text="Enter number of labs:").grid(row=0, column=0)
+    num_labs_entry = tk.Entry(root)
+    num_labs_entry.grid(row=0, column=1)
 
-tk.Button(root, text="Proceed", command=setup_lab_entries).grid(row=0, column=2, padx=10)
-lab_setup_canvas = tk.Canvas(root, height=400)
-lab_setup_scrollbar = tk.Scrollbar(root, orient="vertical", command=lab_setup_canvas.yview)
-lab_setup_scrollable = tk.Frame(lab_setup_canvas)
+    tk.Button(root, text="Proceed", command=setup_lab_entries).grid(row=0, column=2, padx=10)
+    lab_setup_canvas = tk.Canvas(root, height=400)
+    lab_setup_scrollbar = tk.Scrollbar(root, orient="vertical", command=lab_setup_canvas.yview)
+    lab_setup_scrollable = tk.Frame(lab_setup_canvas)
 
-lab_setup_scrollable.bind("<Configure>", lambda e: lab_setup_canvas.configure(scrollregion=lab_setup_canvas.bbox("all")))
-lab_setup_canvas.create_window((0, 0), window=lab_setup_scrollable, anchor="nw")
-lab_setup_canvas.configure(yscrollcommand=lab_setup_scrollbar.set)
+    lab_setup_scrollable.bind("<Configure>", lambda e: lab_setup_canvas.configure(scrollregion=lab_setup_canvas.bbox("all")))
+    lab_setup_canvas.create_window((0, 0), window=lab_setup_scrollable, anchor="nw")
+    lab_setup_canvas.configure(yscrollcommand=lab_setup_scrollbar.set)
 
-lab_setup_canvas.grid(row=1, column=0, columnspan=2, sticky="nsew")
-lab_setup_scrollbar.grid(row=1, column=2, sticky="ns")
+    lab_setup_canvas.grid(row=1, column=0, columnspan=2, sticky="nsew")
+    lab_setup_scrollbar.grid(row=1, column=2, sticky="ns")
 
-lab_setup_window = lab_setup_scrollable
+    lab_setup_window = lab_setup_scrollable
 
-tk.Button(root, text="📊 Open Dashboard", command=open_lab_dashboard).grid(row=2, column=0, columnspan=3, pady=10)
+    tk.Button(root, text="📊 Open Dashboard", command=open_lab_dashboard).grid(row=2, column=0, columnspan=3, pady=10)
 
-root.mainloop()
+    root.mainloop()
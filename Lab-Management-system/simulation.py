@@ -0,0 +1,221 @@
+import argparse
+import collections
+import csv
+import random
+
+from allocation import POLICIES
+from booking_history import parse_booking_rows
+from clock import VirtualClock
+from lab_management_gui_fixed import LabManagementSystem
+from software_catalog import SOFTWARE_OPTIONS
+
+Booking = collections.namedtuple("Booking", "arrival class_name software num_students duration_hours building",
+                                 defaults=(None,))
+Booking.__doc__ = "A class request arriving `arrival` seconds into the simulation, with an optional building hint."
+
+SECONDS_PER_DAY = 24 * 3600
+
+
+def load_lab_capacities(path="lab_capacity.csv"):
+    """Reads lab_capacity.csv into (lab_capacity_list, software_list, buildings).
+
+    `buildings` comes from an optional fourth "Building" column and is None
+    when the file does not have one.
+    """
+    lab_capacity_list, software_list, buildings = [], [], []
+    with open(path, newline="") as file:
+        reader = csv.reader(file)
+        next(reader, None)
+        for row in reader:
+            if len(row) < 3:
+                continue
+            lab_capacity_list.append(int(row[1]))
+            software_list.append([s.strip() for s in row[2].split(",") if s.strip()])
+            buildings.append(row[3].strip() if len(row) > 3 and row[3].strip() else None)
+    if not any(buildings):
+        buildings = None
+    return lab_capacity_list, software_list, buildings
+
+
+def load_booking_trace(path="lab_data.csv", buildings=None):
+    """Turns the booking history in lab_data.csv into a list of Bookings.
+
+    Rows are read with parse_booking_rows; arrivals count from the first row.
+    With `buildings`, each booking's building hint is the building of the lab it
+    was originally given.
+    """
+    with open(path, newline="") as file:
+        records = parse_booking_rows(csv.reader(file))
+    bookings = []
+    for record in records:
+        building = None
+        if buildings and record.lab_id.isdigit() and 0 < int(record.lab_id) <= len(buildings):
+            building = buildings[int(record.lab_id) - 1]
+        arrival = (record.start - records[0].start).total_seconds()
+        bookings.append(Booking(arrival, record.class_name, record.software, record.num_students,
+                                record.duration_hours, building))
+    bookings.sort(key=lambda booking: booking.arrival)
+    return bookings
+
+
+def synthetic_trace(days=100, arrivals_per_hour=2.0, opening_hours=(8, 18), max_students=40,
+                    durations=(1, 1.5, 2, 3), software_options=SOFTWARE_OPTIONS, seed=None):
+    """Generates Poisson class arrivals during opening hours, e.g. for a semester."""
+    rng = random.Random(seed)
+    opens, closes = opening_hours
+    bookings = []
+    for day in range(days):
+        t = day * SECONDS_PER_DAY + opens * 3600
+        end = day * SECONDS_PER_DAY + closes * 3600
+        while True:
+            t += rng.expovariate(arrivals_per_hour / 3600)
+            if t >= end:
+                break
+            software = rng.sample(list(software_options), rng.randint(1, 2))
+            bookings.append(Booking(t, f"Class {len(bookings) + 1}", software,
+                                    rng.randint(5, max_students), rng.choice(durations)))
+    return bookings
+
+
+class SimulationReport:
+    def __init__(self, requested, served, rejected, utilization, waits, lab_hours):
+        self.requested = requested
+        self.served = served
+        self.rejected = rejected
+        self.utilization = utilization
+        self.waits = sorted(waits)
+        self.lab_hours = lab_hours
+
+    @property
+    def rejection_rate(self):
+        return self.rejected / self.requested if self.requested else 0.0
+
+    @property
+    def mean_wait(self):
+        return sum(self.waits) / len(self.waits) if self.waits else 0.0
+
+    @property
+    def p95_wait(self):
+        if not self.waits:
+            return 0.0
+        return self.waits[min(len(self.waits) - 1, int(0.95 * len(self.waits)))]
+
+    @property
+    def busiest_lab_share(self):
+        """Fraction of all class-hours taken by the most used lab."""
+        total = sum(self.lab_hours.values())
+        return max(self.lab_hours.values()) / total if total else 0.0
+
+    def __str__(self):
+        return (f"{self.requested} requested, {self.served} served, {self.rejected} rejected "
+                f"({self.rejection_rate:.1%}); seat utilization {self.utilization:.1%}; "
+                f"wait mean {self.mean_wait / 60:.1f} min, p95 {self.p95_wait / 60:.1f} min; "
+                f"busiest lab {self.busiest_lab_share:.0%} of class-hours")
+
+
+class Simulation:
+    """Replays bookings through LabManagementSystem on a virtual clock.
+
+    Allocation and class expiry run through the real Lab and LabManagementSystem
+    code; only time is simulated. A class that finds no lab waits in a FIFO queue
+    and is retried whenever a lab is released, until `max_wait_hours` pass and it
+    is rejected. Extra keyword arguments are passed to LabManagementSystem.
+    """
+
+    def __init__(self, lab_capacity_list, software_list, max_wait_hours=0.5, **system_options):
+        self.clock = VirtualClock()
+        # Replayed bookings must not be appended to the real booking history.
+        system_options.setdefault("booking_log", None)
+        self.system = LabManagementSystem(lab_capacity_list, software_list, clock=self.clock, **system_options)
+        self.system.release_listeners.append(self._lab_released)
+        self.total_seats = sum(lab_capacity_list)
+        self.max_wait = max_wait_hours * 3600
+        self.waiting = collections.OrderedDict()  # index -> (booking, give-up event)
+        self.requested = self.served = self.rejected = 0
+        self.seat_seconds = 0.0
+        self.waits = []
+        self.lab_hours = {lab.lab_id: 0.0 for lab in self.system.labs}
+
+    def run(self, bookings):
+        """Runs every booking to completion and returns a SimulationReport."""
+        for index, booking in enumerate(bookings):
+            self.clock.call_at(booking.arrival, self._arrive, index, booking)
+        start = min((booking.arrival for booking in bookings), default=0.0)
+        self.clock.run()
+        elapsed = self.clock.now() - start
+        utilization = self.seat_seconds / (self.total_seats * elapsed) if self.total_seats and elapsed else 0.0
+        return SimulationReport(self.requested, self.served, self.rejected, utilization, self.waits, self.lab_hours)
+
+    def _try_assign(self, booking):
+        lab = self.system.assign_class_to_lab(booking.class_name, booking.software, booking.num_students,
+                                              booking.duration_hours, building=booking.building)
+        if lab is None:
+            return False
+        self.served += 1
+        self.lab_hours[lab.lab_id] += booking.duration_hours
+        self.seat_seconds += booking.num_students * booking.duration_hours * 3600
+        self.waits.append(self.clock.now() - booking.arrival)
+        return True
+
+    def _arrive(self, index, booking):
+        self.requested += 1
+        if self._try_assign(booking):
+            return
+        if self.system.catalog.required_ids(booking.software) is None or self.max_wait <= 0:
+            self.rejected += 1
+            return
+        self.waiting[index] = (booking, self.clock.call_later(self.max_wait, self._give_up, index))
+
+    def _give_up(self, index):
+        if self.waiting.pop(index, None) is not None:
+            self.rejected += 1
+
+    def _lab_released(self, lab):
+        for index, (booking, give_up) in list(self.waiting.items()):
+            if lab.current_class is not None:
+                break
+            if self._try_assign(booking):
+                # A stale give-up event would keep the clock running and inflate `elapsed`.
+                give_up.cancel()
+                del self.waiting[index]
+
+
+def compare_policies(lab_capacity_list, software_list, bookings, policies=tuple(POLICIES),
+                     max_wait_hours=0.5, buildings=None):
+    """Replays the same bookings under each policy; returns {policy name: SimulationReport}."""
+    return {
+        policy: Simulation(lab_capacity_list, software_list, max_wait_hours,
+                           policy=policy, buildings=buildings).run(bookings)
+        for policy in policies
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay lab bookings on a virtual clock.")
+    parser.add_argument("--labs", default="lab_capacity.csv")
+    parser.add_argument("--bookings", default="lab_data.csv", help="booking history to replay")
+    parser.add_argument("--synthetic-days", type=int, default=0,
+                        help="replay a synthetic arrival process of this many days instead")
+    parser.add_argument("--arrivals-per-hour", type=float, default=2.0)
+    parser.add_argument("--max-wait", type=float, default=0.5, help="hours a class waits before rejection")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--policy", choices=sorted(POLICIES), action="append",
+                        help="allocation policy to replay; repeat to compare (default: all)")
+    args = parser.parse_args()
+
+    lab_capacity_list, software_list, buildings = load_lab_capacities(args.labs)
+    if args.synthetic_days:
+        software = sorted({name for names in software_list for name in names})
+        bookings = synthetic_trace(args.synthetic_days, args.arrivals_per_hour,
+                                   max_students=max(lab_capacity_list), software_options=software, seed=args.seed)
+    else:
+        bookings = load_booking_trace(args.bookings, buildings)
+
+    reports = compare_policies(lab_capacity_list, software_list, bookings,
+                               args.policy or tuple(POLICIES), args.max_wait, buildings)
+    for policy, report in reports.items():
+        print(f"{policy}: {report}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+import copy
+import re
+
+SOFTWARE_OPTIONS = [
+    "ANACONDA3", "DEV C++", "TURBO C++", "PYTHON", "VS CODE", "JAVA", "JDK",
+    "TALLY PRIME", "GOOGLE CHROME", "R STUDIO", "MYSQL SERVER AND WORKBENCH",
+    "ORACLE VM VIRTUAL BOX", "CISCO PACKET TRACER", "XCODE", "ADOBE READER XI",
+    "AUTOCAD 2024", "LINUX (UBUNTU - CMD BASED)", "WINRAR", "NODEJS", "ECLIPSE IDE",
+    "LINUX - UBUNTU", "TABLEAU", "MATLAB R2024b"
+]
+
+# Alternative spellings mapped to the canonical name they stand for.
+SOFTWARE_ALIASES = {
+    "ECLIPCE IDE": "ECLIPSE IDE",
+    "ECLIPSE": "ECLIPSE IDE",
+    "ANACONDA": "ANACONDA3",
+    "VSCODE": "VS CODE",
+    "VISUAL STUDIO CODE": "VS CODE",
+    "CHROME": "GOOGLE CHROME",
+    "RSTUDIO": "R STUDIO",
+    "MYSQL": "MYSQL SERVER AND WORKBENCH",
+    "MYSQL WORKBENCH": "MYSQL SERVER AND WORKBENCH",
+    "VIRTUALBOX": "ORACLE VM VIRTUAL BOX",
+    "VIRTUAL BOX": "ORACLE VM VIRTUAL BOX",
+    "PACKET TRACER": "CISCO PACKET TRACER",
+    "NODE.JS": "NODEJS",
+    "NODE JS": "NODEJS",
+    "ADOBE READER": "ADOBE READER XI",
+    "TALLY": "TALLY PRIME",
+}
+
+# A trailing token such as "8", "2024", "R2024b", "v3" or "11.0.2" is read as a version.
+VERSION_PATTERN = re.compile(r"^(?:R\d{4}[A-Z]?|V?\d+(?:\.\d+)*)$")
+
+
+def normalize_name(name):
+    """Uppercases a software name and collapses surrounding/inner whitespace."""
+    return " ".join(name.upper().split())
+
+
+def split_version(name):
+    """Splits a normalized name into (product, version); version is None if absent."""
+    parts = name.rsplit(" ", 1)
+    if len(parts) == 2 and VERSION_PATTERN.match(parts[1]):
+        return parts[0], parts[1]
+    return name, None
+
+
+def trigrams(text):
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SoftwareCatalog:
+    """Maps software names, aliases and versions to canonical integer IDs.
+
+    Every product gets one ID and every product/version pair gets its own ID, so
+    an installed "MATLAB R2024b" expands to {MATLAB, MATLAB R2024b} and satisfies
+    a requirement for plain "MATLAB". Names are resolved once when labs are set
+    up, and each requirement list is resolved once and cached; matching
+    afterwards is a subset test on frozensets of IDs.
+
+    Fuzzy lookups only correct typos: the trigram similarity must reach
+    `fuzzy_threshold` and the name must have the same number of words and
+    about the same length. Weaker matches are only offered as suggestions.
+    """
+
+    def __init__(self, software_names=(), aliases=None, fuzzy_threshold=0.8, suggestion_threshold=0.5):
+        self.fuzzy_threshold = fuzzy_threshold
+        self.suggestion_threshold = suggestion_threshold
+        self.names = []          # ID -> display name
+        self.parent = []         # ID -> product ID for versioned entries, else None
+        self._ids = {}           # normalized name -> ID
+        self._aliases = {}       # normalized alias -> normalized canonical product
+        self._trigram_index = {}  # trigram -> set of normalized product keys
+        self._key_size = {}      # normalized product key -> number of trigrams
+        self._required = {}      # tuple of requested names -> frozenset of IDs, or None
+
+        for name in software_names:
+            self.register(name)
+        for alias, canonical in (aliases or {}).items():
+            self.add_alias(alias, canonical)
+
+    def __len__(self):
+        return len(self.names)
+
+    def name_of(self, software_id):
+        return self.names[software_id]
+
+    def copy(self):
+        """An independent catalog, so one lab setup's software does not leak into another."""
+        return copy.deepcopy(self)
+
+    def register(self, name):
+        """Adds a software name to the catalog (if new) and returns its ID."""
+        normalized = normalize_name(name)
+        if not normalized:
+            return None
+        if normalized in self._ids:
+            return self._ids[normalized]
+
+        product, version = split_version(normalized)
+        if version is None:
+            return self._new_id(normalized, name.strip(), None)
+        product_id = self.register(product)
+        return self._new_id(normalized, name.strip(), product_id)
+
+    def add_alias(self, alias, canonical):
+        alias = normalize_name(alias)
+        canonical = normalize_name(canonical)
+        if alias == canonical:
+            return
+        self.register(canonical)
+        self._aliases[alias] = canonical
+        self._index_key(alias)
+        self._required.clear()
+
+    def _new_id(self, normalized, display_name, parent_id):
+        # A requirement cached as unknown may now resolve.
+        self._required.clear()
+        software_id = len(self.names)
+        self.names.append(display_name)
+        self.parent.append(parent_id)
+        self._ids[normalized] = software_id
+        if parent_id is None:
+            self._index_key(normalized)
+        return software_id
+
+    def _index_key(self, key):
+        grams = trigrams(key)
+        self._key_size[key] = len(grams)
+        for gram in grams:
+            self._trigram_index.setdefault(gram, set()).add(key)
+
+    def _closest_key(self, normalized):
+        """Returns (key, Dice score) of the indexed product key most similar to `normalized`."""
+        grams = trigrams(normalized)
+        shared = {}
+        for gram in grams:
+            for key in self._trigram_index.get(gram, ()):
+                shared[key] = shared.get(key, 0) + 1
+
+        best_key, best_score = None, 0.0
+        for key, count in shared.items():
+            score = 2 * count / (len(grams) + self._key_size[key])
+            if score > best_score:
+                best_key, best_score = key, score
+        return best_key, best_score
+
+    def _typo_key(self, normalized):
+        """The indexed key `normalized` is a plain misspelling of, or None."""
+        key, score = self._closest_key(normalized)
+        if (key is None or score < self.fuzzy_threshold
+                or len(key.split()) != len(normalized.split())
+                or abs(len(key) - len(normalized)) > 2):
+            return None
+        return key
+
+    def _product_id(self, product, fuzzy=False):
+        key = self._aliases.get(product, product)
+        if key in self._ids:
+            return self._ids[key]
+        if not fuzzy:
+            return None
+        key = self._typo_key(product)
+        if key is None:
+            return None
+        return self._ids[self._aliases.get(key, key)]
+
+    def suggest(self, name):
+        """Display name of the closest known product, or None if nothing is close."""
+        key, score = self._closest_key(split_version(normalize_name(name))[0])
+        if key is None or score < self.suggestion_threshold:
+            return None
+        return self.names[self._ids[self._aliases.get(key, key)]]
+
+    def resolve(self, name, fuzzy=True):
+        """Returns the canonical ID for a name, or None if it cannot be matched.
+
+        Exact names and aliases are tried first, then typo correction. Names
+        with a version are never fuzzy-matched, so "JAVA 21" cannot fall back to
+        plain JAVA; a version the catalog has not seen yet resolves to no ID,
+        since no lab can be known to have it installed.
+        """
+        normalized = normalize_name(name)
+        if normalized in self._ids:
+            return self._ids[normalized]
+        if normalized in self._aliases:
+            return self._ids[self._aliases[normalized]]
+
+        product, version = split_version(normalized)
+        if version is None:
+            return self._product_id(product, fuzzy)
+        product_id = self._product_id(product)
+        if product_id is None:
+            return None
+        return self._ids.get(f"{normalize_name(self.names[product_id])} {version}")
+
+    def installed_ids(self, software_names):
+        """IDs provided by a lab's installed software, including parent products.
+
+        Only exact names and aliases are matched; anything else is registered as
+        new software rather than guessed, so a lab is never credited with
+        software it does not have.
+        """
+        ids = set()
+        for name in software_names:
+            software_id = self.resolve(name, fuzzy=False)
+            if software_id is None:
+                software_id = self.register(name)
+            while software_id is not None:
+                ids.add(software_id)
+                software_id = self.parent[software_id]
+        return frozenset(ids)
+
+    def required_ids(self, software_names):
+        """IDs needed by a class, or None if any requirement is unknown."""
+        key = tuple(software_names)
+        if key in self._required:
+            return self._required[key]
+        ids = set()
+        for name in software_names:
+            if not name.strip():
+                continue
+            software_id = self.resolve(name)
+            if software_id is None:
+                ids = None
+                break
+            ids.add(software_id)
+        self._required[key] = result = None if ids is None else frozenset(ids)
+        return result
+
+    def describe_unknown(self, software_names):
+        """Lists the requested names that cannot be resolved, with suggestions."""
+        unknown = []
+        for name in software_names:
+            if not name.strip() or self.resolve(name) is not None:
+                continue
+            suggestion = self.suggest(name)
+            unknown.append(f"{name.strip()} (did you mean {suggestion}?)" if suggestion else name.strip())
+        return ", ".join(unknown)
+
+
+DEFAULT_CATALOG = SoftwareCatalog(SOFTWARE_OPTIONS, SOFTWARE_ALIASES)
@@ -0,0 +1,82 @@
+import itertools
+import random
+
+from allocation import POLICIES
+from clock import VirtualClock
+from lab_management_gui_fixed import LabManagementSystem
+
+SOFTWARE = ["JAVA", "PYTHON", "MATLAB R2024b", "TABLEAU", "R STUDIO"]
+REQUESTS = [["JAVA"], ["MATLAB"], ["MATLAB R2024b"], ["JAVA", "PYTHON"], ["TABLEAU", "R STUDIO"], []]
+
+
+def make_system(rng, policy, num_labs=40):
+    capacities = [rng.choice([10, 20, 30, 40]) for _ in range(num_labs)]
+    software = [rng.sample(SOFTWARE, rng.randint(1, 4)) for _ in range(num_labs)]
+    buildings = [rng.choice("ABC") for _ in range(num_labs)]
+    return LabManagementSystem(capacities, software, clock=VirtualClock(), policy=policy,
+                               buildings=buildings, booking_log=None)
+
+
+def brute_force(system, policy, num_students, required_ids, building, released_at):
+    """The lab each policy should pick, found by scanning every lab."""
+    suitable = [lab for lab in system.labs
+                if lab.current_class is None and lab.num_computers >= num_students
+                and required_ids <= lab.software_ids]
+    if not suitable:
+        return None
+    if policy == "first-fit":
+        return suitable[0]
+    if policy == "least-recently-used":
+        return min(suitable, key=lambda lab: released_at[lab.lab_id])
+    if policy == "building-locality":
+        nearby = [lab for lab in suitable if lab.building == building]
+        suitable = nearby or suitable
+    return min(suitable, key=lambda lab: (lab.num_computers, lab.lab_id))
+
+
+def check_policy(policy, seed):
+    rng = random.Random(seed)
+    system = make_system(rng, policy)
+    sequence = itertools.count()
+    released_at = {lab.lab_id: next(sequence) for lab in system.labs}
+    system.release_listeners.append(lambda lab: released_at.__setitem__(lab.lab_id, next(sequence)))
+
+    for step in range(2000):
+        system.clock.run(until=system.clock.now() + 900)
+        if rng.random() < 0.75:
+            request = rng.choice(REQUESTS)
+            num_students = rng.randint(1, 40)
+            building = rng.choice("ABC")
+            expected = brute_force(system, policy, num_students, system.catalog.required_ids(request),
+                                   building, released_at)
+            lab = system.assign_class_to_lab(f"Class {step}", request, num_students,
+                                             rng.choice([0.5, 1, 2]), building=building)
+            assert lab is expected, (policy, step)
+        else:
+            occupied = [lab for lab in system.labs if lab.current_class is not None]
+            if occupied:
+                rng.choice(occupied).remove_class()
+
+
+def test_policies_match_brute_force_scan():
+    for policy in POLICIES:
+        for seed in range(3):
+            check_policy(policy, seed)
+
+
+def test_per_request_policy_stays_in_sync():
+    rng = random.Random(7)
+    system = make_system(rng, "first-fit")
+    for step in range(2000):
+        system.clock.run(until=system.clock.now() + 900)
+        policy = rng.choice(list(POLICIES))
+        request = rng.choice(REQUESTS)
+        num_students = rng.randint(1, 40)
+        lab = system.assign_class_to_lab(f"Class {step}", request, num_students, rng.choice([0.5, 1, 2]),
+                                         policy=policy, building=rng.choice("ABC"))
+        required_ids = system.catalog.required_ids(request)
+        if lab is None:
+            assert not any(other.current_class is None and other.num_computers >= num_students
+                           and required_ids <= other.software_ids for other in system.labs)
+        else:
+            assert lab.current_class == f"Class {step}" and required_ids <= lab.software_ids
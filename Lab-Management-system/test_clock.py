@@ -0,0 +1,37 @@
+from clock import VirtualClock
+
+
+def test_events_run_in_time_then_scheduling_order():
+    clock = VirtualClock()
+    log = []
+    clock.call_at(30, log.append, "c")
+    clock.call_later(10, log.append, "a")
+    clock.call_at(10, log.append, "b")
+    clock.call_at(20, lambda: clock.call_later(5, log.append, "nested"))
+    clock.run()
+    assert log == ["a", "b", "nested", "c"]
+    assert clock.now() == 30
+
+
+def test_cancelled_events_do_not_run_or_move_time():
+    clock = VirtualClock()
+    log = []
+    clock.call_at(10, log.append, "kept")
+    clock.call_at(50, log.append, "cancelled").cancel()
+    clock.run()
+    assert log == ["kept"]
+    assert clock.now() == 10
+
+
+def test_run_until_stops_at_the_given_time():
+    clock = VirtualClock(start=100)
+    log = []
+    clock.call_later(10, log.append, 110)
+    clock.call_later(30, log.append, 130)
+    clock.run(until=120)
+    assert log == [110] and clock.now() == 120
+    clock.call_at(0, log.append, "past")  # never scheduled before the present
+    clock.run(until=125)
+    assert log == [110, "past"] and clock.now() == 125
+    clock.run()
+    assert log == [110, "past", 130] and clock.now() == 130
@@ -0,0 +1,110 @@
+import csv
+import datetime
+import random
+
+import numpy as np
+
+from booking_history import UNDATED_ORIGIN, parse_booking_rows
+from forecast import DemandForecaster
+
+SOFTWARE = ["JAVA", "PYTHON", "MATLAB R2024b", "TABLEAU"]
+
+
+def booking_rows(count, seed=0):
+    """Rows as the booking writers record them; every third one has only a clock time."""
+    rng = random.Random(seed)
+    start = datetime.datetime(2024, 1, 1, 8)
+    rows = []
+    for i in range(count):
+        start += datetime.timedelta(minutes=rng.randint(20, 600))
+        moment = start.strftime("%H:%M:%S") if i % 3 else start.strftime("%Y-%m-%d %H:%M:%S")
+        rows.append([str(rng.randint(1, 10)), f"Class {i}", ", ".join(rng.sample(SOFTWARE, 2)),
+                     moment, str(rng.choice([0.5, 1, 1.5, 2])), str(rng.randint(5, 40))])
+    return rows
+
+
+def write_rows(path, rows, mode="w"):
+    with open(path, mode, newline="") as file:
+        csv.writer(file).writerows(rows)
+
+
+def assert_same_model(first, second):
+    assert first.offset == second.offset
+    assert first.seats.keys() == second.seats.keys()
+    for week in first.seats:
+        assert np.allclose(first.seats[week], second.seats[week])
+    assert first.software.keys() == second.software.keys()
+    for name, weeks in first.software.items():
+        assert weeks.keys() == second.software[name].keys()
+        for week in weeks:
+            assert np.allclose(weeks[week], second.software[name][week])
+
+
+def test_interrupted_training_matches_training_at_once(tmp_path):
+    rows = booking_rows(400)
+    bookings, state = tmp_path / "lab_data.csv", tmp_path / "state.npz"
+
+    write_rows(bookings, rows[:150])
+    forecaster = DemandForecaster()
+    assert forecaster.update_from_csv(bookings) == (150, 0)
+    forecaster.save(state)
+    write_rows(bookings, rows[150:], mode="a")
+    forecaster = DemandForecaster.load(state)
+    assert forecaster.update_from_csv(bookings) == (250, 0)
+
+    at_once = DemandForecaster()
+    at_once.update_from_csv(bookings)
+    assert_same_model(forecaster, at_once)
+
+    expected = sum(float(row[4]) * int(row[5]) for row in rows)
+    assert np.isclose(sum(seats.sum() for seats in forecaster.seats.values()), expected)
+    # The product is credited whenever the installed version is booked.
+    matlab = forecaster.software["MATLAB"]
+    versioned = forecaster.software["MATLAB R2024b"]
+    assert matlab.keys() == versioned.keys()
+    assert all(np.allclose(matlab[week], versioned[week]) for week in matlab)
+
+
+def test_partly_written_last_line_waits_for_the_rest(tmp_path):
+    rows = booking_rows(3)
+    bookings = tmp_path / "lab_data.csv"
+    write_rows(bookings, rows[:2])
+    last = ",".join(f'"{value}"' for value in rows[2]) + "\r\n"
+    with open(bookings, "a", newline="") as file:
+        file.write(last[:12])
+
+    forecaster = DemandForecaster()
+    assert forecaster.update_from_csv(bookings) == (2, 0)
+    with open(bookings, "a", newline="") as file:
+        file.write(last[12:])
+    assert forecaster.update_from_csv(bookings) == (1, 0)
+
+    at_once = DemandForecaster()
+    at_once.update_from_csv(bookings)
+    assert_same_model(forecaster, at_once)
+
+
+def test_time_only_rows_roll_over_to_the_next_day():
+    records = parse_booking_rows([
+        ["1", "A", "JAVA", "09:00:00", "1", "10"],
+        ["1", "B", "JAVA", "2024-03-04 22:00:00", "1", "10"],
+        ["2", "C", "JAVA", "23:30:00", "1", "10"],
+        ["3", "D", "JAVA", "01:00:00", "1", "10"],
+        ["3", "E", "JAVA", "not a time", "1", "10"],
+    ])
+    assert [(record.start, record.dated) for record in records] == [
+        (datetime.datetime.combine(UNDATED_ORIGIN, datetime.time(9)), False),
+        (datetime.datetime(2024, 3, 4, 22), True),
+        (datetime.datetime(2024, 3, 4, 23, 30), True),
+        (datetime.datetime(2024, 3, 5, 1), True),
+    ]
+
+
+def test_forecast_accepts_a_datetime():
+    forecaster = DemandForecaster()
+    forecaster.observe(["JAVA"], datetime.datetime(2024, 3, 4, 9), 2, 30)
+    by_date = forecaster.forecast(2, today=datetime.date(2024, 3, 13))
+    by_datetime = forecaster.forecast(2, today=datetime.datetime(2024, 3, 13, 15, 30))
+    assert by_date["weeks"] == by_datetime["weeks"] == [datetime.date(2024, 3, 11), datetime.date(2024, 3, 18)]
+    assert np.array_equal(by_date["seats"], by_datetime["seats"])
+    assert by_date["seats"].sum() > 0
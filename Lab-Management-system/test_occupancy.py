@@ -0,0 +1,72 @@
+import random
+
+from clock import VirtualClock
+from lab_management_gui_fixed import LabManagementSystem
+
+SOFTWARE = ["JAVA", "PYTHON", "MATLAB R2024b", "TABLEAU"]
+
+
+def rescan(system):
+    """The snapshot figures, recomputed from every lab."""
+    vacant = [lab for lab in system.labs if lab.current_class is None]
+    software_bookable = {}
+    for lab in system.labs:
+        for software_id in lab.software_ids:
+            name = system.catalog.name_of(software_id)
+            software_bookable[name] = software_bookable.get(name, 0) + (lab in vacant) * lab.num_computers
+    buildings = {}
+    for lab in system.labs:
+        labs, occupied, total, free, bookable = buildings.get(lab.building, (0, 0, 0, 0, 0))
+        buildings[lab.building] = (labs + 1, occupied + (lab not in vacant), total + lab.num_computers,
+                                   free + lab.available_computers, bookable + (lab in vacant) * lab.num_computers)
+    return {
+        "occupied": len(system.labs) - len(vacant),
+        "vacant": len(vacant),
+        "total_seats": sum(lab.num_computers for lab in system.labs),
+        "free_seats": sum(lab.available_computers for lab in system.labs),
+        "bookable_seats": sum(lab.num_computers for lab in vacant),
+        "software_bookable": software_bookable,
+        "buildings": buildings,
+    }
+
+
+def test_snapshot_matches_rescan():
+    rng = random.Random(1)
+    num_labs = 50
+    system = LabManagementSystem([rng.choice([10, 20, 30]) for _ in range(num_labs)],
+                                 [rng.sample(SOFTWARE, 2) for _ in range(num_labs)],
+                                 clock=VirtualClock(), buildings=[rng.choice("XYZ") for _ in range(num_labs)],
+                                 booking_log=None)
+    for step in range(3000):
+        system.clock.run(until=system.clock.now() + 600)
+        if rng.random() < 0.7:
+            system.assign_class_to_lab(f"Class {step}", [rng.choice(["JAVA", "MATLAB", "TABLEAU"])],
+                                       rng.randint(1, 30), rng.choice([0.5, 1, 2]),
+                                       policy=rng.choice(["first-fit", "best-fit", "building-locality"]),
+                                       building=rng.choice("XYZ"))
+        else:
+            occupied = [lab for lab in system.labs if lab.current_class is not None]
+            if occupied:
+                rng.choice(occupied).remove_class()
+
+        snapshot = system.snapshot()
+        expected = rescan(system)
+        assert {key: getattr(snapshot, key) for key in expected if key != "buildings"} == \
+            {key: value for key, value in expected.items() if key != "buildings"}
+        assert {building: (totals.labs, totals.occupied, totals.total_seats, totals.free_seats, totals.bookable_seats)
+                for building, totals in snapshot.buildings.items()} == expected["buildings"]
+        assert system.get_occupied_and_vacant_labs() == (expected["occupied"], expected["vacant"])
+
+
+def test_stale_expiry_does_not_end_the_next_class():
+    system = LabManagementSystem([20], [["JAVA"]], clock=VirtualClock(), booking_log=None)
+    lab = system.assign_class_to_lab("First", ["JAVA"], 10, 1)
+    stale = lab.expiry
+    lab.remove_class()
+    system.assign_class_to_lab("Second", ["JAVA"], 10, 2)
+    # As if a wall-clock timer had fired just before remove_class cancelled it.
+    stale.callback(*stale.args)
+    assert lab.current_class == "Second"
+    assert system.get_occupied_and_vacant_labs() == (1, 0)
+    system.clock.run()
+    assert lab.current_class is None and system.clock.now() == 7200
@@ -0,0 +1,35 @@
+import pytest
+
+from simulation import Booking, Simulation
+
+
+def test_report_for_a_hand_computed_trace():
+    # Two 20-seat JAVA labs. A and B take both labs at once; C and D queue.
+    # C gets lab 1 when A ends at 1h; D gets lab 2 when B ends at 2h.
+    bookings = [
+        Booking(0, "A", ["JAVA"], 10, 1),
+        Booking(0, "B", ["JAVA"], 20, 2),
+        Booking(1800, "C", ["JAVA"], 10, 1),
+        Booking(1800, "D", ["JAVA"], 15, 1),
+        Booking(100, "E", ["FORTRAN"], 10, 1),
+    ]
+    simulation = Simulation([20, 20], [["JAVA"], ["JAVA"]], max_wait_hours=3)
+    report = simulation.run(bookings)
+
+    assert (report.requested, report.served, report.rejected) == (5, 4, 1)
+    assert report.waits == [0, 0, 1800, 5400]
+    assert report.mean_wait == 1800
+    assert report.lab_hours == {1: 2, 2: 3}
+    assert report.busiest_lab_share == pytest.approx(0.6)
+    # 270000 seat-seconds over 40 seats for the 3 hours until D ends; the
+    # cancelled give-up events at 3.5h must not stretch the run.
+    assert simulation.clock.now() == 10800
+    assert report.utilization == pytest.approx(270000 / (40 * 10800))
+
+
+def test_waiting_class_is_rejected_after_max_wait():
+    bookings = [Booking(0, "A", ["JAVA"], 10, 2), Booking(600, "B", ["JAVA"], 10, 1)]
+    report = Simulation([20], [["JAVA"]], max_wait_hours=1).run(bookings)
+    assert (report.requested, report.served, report.rejected) == (2, 1, 1)
+    assert report.rejection_rate == 0.5
+    assert report.waits == [0]
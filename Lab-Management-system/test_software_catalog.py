@@ -0,0 +1,38 @@
+from lab_management_gui_fixed import LabManagementSystem
+from software_catalog import DEFAULT_CATALOG
+
+
+def test_exact_names_and_aliases():
+    catalog = DEFAULT_CATALOG.copy()
+    assert catalog.resolve("ECLIPCE IDE") == catalog.resolve("ECLIPSE IDE")
+    assert catalog.resolve("vscode") == catalog.resolve("VS CODE")
+    assert catalog.required_ids(["  python ", "", "JAVA"]) == catalog.required_ids(["PYTHON", "JAVA"])
+    assert catalog.installed_ids([" PYTHON  "]) == catalog.installed_ids(["PYTHON"])
+
+
+def test_versions_satisfy_their_product_only():
+    catalog = DEFAULT_CATALOG.copy()
+    installed = catalog.installed_ids(["MATLAB R2024b"])
+    assert catalog.required_ids(["MATLAB"]) <= installed
+    assert catalog.required_ids(["MATLAB R2024b"]) <= installed
+    assert not catalog.required_ids(["MATLAB R2024b"]) <= catalog.installed_ids(["MATLAB"])
+    assert catalog.required_ids(["MATLAB R2023a"]) is None
+
+
+def test_different_products_are_not_fuzzy_matched():
+    catalog = DEFAULT_CATALOG.copy()
+    for name, suggestion in [("VISUAL STUDIO", "VS CODE"), ("DEV C#", "DEV C++"),
+                             ("JAVAFX", "JAVA"), ("TALLY ERP", "TALLY PRIME")]:
+        assert catalog.resolve(name) is None
+        assert catalog.required_ids([name]) is None
+        assert catalog.describe_unknown([name]) == f"{name} (did you mean {suggestion}?)"
+    assert catalog.resolve("CISCO PACKET TRACR") == catalog.resolve("CISCO PACKET TRACER")
+
+
+def test_each_system_has_its_own_catalog():
+    size = len(DEFAULT_CATALOG.names)
+    first = LabManagementSystem([10], [["LABVIEW"]], booking_log=None)
+    second = LabManagementSystem([10], [["JAVA"]], booking_log=None)
+    assert len(DEFAULT_CATALOG.names) == size
+    assert first.catalog.required_ids(["LABVIEW"]) is not None
+    assert second.catalog.required_ids(["LABVIEW"]) is None